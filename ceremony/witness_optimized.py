@@ -0,0 +1,988 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Glogos Genesis Ceremony Script (Python, performance-tuned)
+
+Optimized variant of ceremony/witness.py. The attested witness.py is
+pinned byte-for-byte by witness.py.glo and witness.py.asc and must not
+change; performance work lands here instead. This module produces
+IDENTICAL artifacts to the attested script — only the implementation
+differs (precomputed constants, direct libsodium bindings, overlapped
+witness fetches, buffered output).
+
+Self-contained ceremony script with full Ed25519 cryptography.
+Can be run multiple times to verify deterministic output.
+
+Runs the complete genesis ceremony:
+1. Derive genesis zone from GLR (deterministic)
+2. Create and sign genesis attestation
+3. Fetch entropy witnesses (drand + Bitcoin)
+4. Verify everything
+5. Save artifacts
+
+Run: python ceremony/witness_optimized.py
+Requires: pip install pynacl
+
+This script produces IDENTICAL output to witness.ts
+"""
+
+import functools
+import hashlib
+import http.client
+import json
+import ssl
+import struct
+import sys
+import urllib.request
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Any, Tuple
+
+# Fix Windows console encoding
+if sys.platform == 'win32':
+    try:
+        sys.stdout.reconfigure(encoding='utf-8')
+        sys.stderr.reconfigure(encoding='utf-8')
+    except (AttributeError, OSError):
+        # Python < 3.7 or reconfigure not available
+        import io
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+# Ed25519 via libsodium (PyNaCl). We go through nacl.bindings straight to
+# the libsodium calls instead of the SigningKey/VerifyKey wrapper objects:
+# no per-call wrapper allocation, and the signature math itself is the
+# optimized libsodium implementation either way.
+try:
+    from nacl.bindings import (
+        crypto_sign,
+        crypto_sign_open,
+        crypto_sign_seed_keypair,
+        crypto_sign_BYTES,
+    )
+    NACL_AVAILABLE = True
+except ImportError:
+    NACL_AVAILABLE = False
+    print("⚠️  PyNaCl not installed. Run: pip install pynacl")
+    print("   Falling back to pre-computed values (verification only)\n")
+
+# orjson (optional): Rust-compiled JSON encoder, serializes the artifact in
+# one shot. The stdlib fallback produces byte-identical output.
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    _loads = orjson.loads  # accepts bytes directly, no decode step
+except ImportError:
+    ORJSON_AVAILABLE = False
+    _loads = json.loads
+
+# ============================================================================
+# PROTOCOL CONSTANTS (from GENESIS.md)
+# ============================================================================
+GENESIS_TIMESTAMP = 1766329380  # 2025-12-21T15:03:00 UTC
+GLR = "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
+DOMAIN_SEPARATOR = "glogos-genesis"
+REFS_DELIMITER = "|"
+
+# External entropy sources
+DRAND_CHAIN_HASH = "52db9ba70e0cc0f6eaf7803dd07447a1f5477735fd3f661792ba94600c84e971"
+DRAND_ENDPOINT = f"https://api.drand.sh/{DRAND_CHAIN_HASH}/public/latest"
+NIST_BEACON_URL = "https://beacon.nist.gov/beacon/2.0/pulse/last"
+BITCOIN_API = "https://blockstream.info/api/blocks/tip/hash"
+BITCOIN_HEIGHT_API = "https://blockstream.info/api/blocks/tip/height"
+
+# Binary forms of the protocol constants, decoded once at import so the
+# hashing paths never re-parse hex per call. Hex encoding only happens at
+# the JSON artifact boundary.
+_GLR_B = bytes.fromhex(GLR)
+_DOMAIN_B = DOMAIN_SEPARATOR.encode('utf-8')
+_SUBJECT_B = hashlib.sha256(b"From nothing, truth emerges").digest()
+_CANON_B = hashlib.sha256(b"raw:sha256:1.0").digest()
+_TIME_B = struct.pack('>Q', GENESIS_TIMESTAMP)
+
+# Ceremony moment as datetime / display string, derived once from the
+# timestamp so no caller re-parses or re-formats it.
+_CEREMONY_DT = datetime.fromtimestamp(GENESIS_TIMESTAMP, tz=timezone.utc)
+_CEREMONY_STR = _CEREMONY_DT.strftime('%Y-%m-%dT%H:%M:%S.000Z')
+
+# ============================================================================
+# CRYPTOGRAPHIC PRIMITIVES
+# ============================================================================
+
+# CPython's hashlib routes sha256 through OpenSSL, which dispatches to the
+# CPU's SHA extensions (SHA-NI / ARMv8-CE) when present — run
+# `python -c "import ssl; print(ssl.OPENSSL_VERSION)"` to confirm the
+# backend. Bind the constructor once so the hot helpers skip the module
+# attribute lookup per call.
+_SHA256 = hashlib.sha256
+
+
+def _sign_detached(message: bytes, secret_key: bytes) -> bytes:
+    """
+    Detached Ed25519 signature via libsodium's combined-mode call.
+
+    The bindings expose only crypto_sign (sig || message); the detached
+    signature is its first crypto_sign_BYTES bytes, exactly as
+    SigningKey.sign slices it.
+    """
+    return crypto_sign(message, secret_key)[:crypto_sign_BYTES]
+
+
+def _verify_detached(signature: bytes, message: bytes, public_key: bytes) -> None:
+    """Verify a detached signature; raises on mismatch."""
+    crypto_sign_open(signature + message, public_key)
+
+
+def sha256_hex(data: bytes) -> str:
+    """Compute SHA-256 hash of bytes and return as hex string."""
+    return _SHA256(data).hexdigest()
+
+
+def sha256_hex_str(data: str) -> str:
+    """Compute SHA-256 hash of a UTF-8 string and return as hex string.
+
+    Split from sha256_hex so the hot bytes path carries no isinstance
+    branch or re-encode check per call.
+    """
+    return _SHA256(data.encode('utf-8')).hexdigest()
+
+
+def sha256_bytes(data: bytes) -> bytes:
+    """Compute SHA-256 hash and return as bytes."""
+    return _SHA256(data).digest()
+
+
+def uint64_be(n: int) -> bytes:
+    """Convert integer to 8-byte big-endian bytes."""
+    return struct.pack('>Q', n)
+
+
+def hex_to_bytes(hex_str: str) -> bytes:
+    """Convert hex string to bytes."""
+    return bytes.fromhex(hex_str)
+
+
+def bytes_to_hex(data: bytes) -> str:
+    """Convert bytes to hex string."""
+    return data.hex()
+
+
+# ============================================================================
+# ZONE OPERATIONS
+# ============================================================================
+
+@functools.cache
+def _genesis_keypair() -> Tuple[bytes, bytes]:
+    """
+    Derive the genesis (public_key, secret_key) once per process.
+
+    GLR and the domain separator are constants, so the seed hash and the
+    Ed25519 seed expansion never change between calls.
+    """
+    seed = sha256_bytes(_GLR_B + _DOMAIN_B)
+    return crypto_sign_seed_keypair(seed)
+
+
+@functools.cache
+def derive_genesis_zone() -> Dict[str, str]:
+    """
+    Derive genesis zone from GLR (deterministic, publicly verifiable).
+
+    seed = SHA-256(GLR || domain_separator)
+    keypair = Ed25519_KeyPair_From_Seed(seed)
+    zone_id = SHA-256(public_key)
+
+    Cached: main, create_genesis_attestation and verify_artifact all need
+    the zone, and the derivation is pure.
+    """
+    if not NACL_AVAILABLE:
+        # Fallback to pre-computed values
+        return {
+            'seed': 'ae958e20ef38261f13a52590ee631ca83d718ea62d03f22774affd43c01bb902',
+            'private_key': 'ae958e20ef38261f13a52590ee631ca83d718ea62d03f22774affd43c01bb902',
+            'public_key': 'c70b1f7e4ce8cb7f6f8f3984ff6fe8260469b6cf8f8f839f047ba64d894d4be8',
+            'zone_id': 'db1756c17220873bcb831c2f9c197081ab0d83acf2226b819880d62ce906c010'
+        }
+    
+    # Compute seed: SHA-256(GLR || domain)
+    seed = sha256_bytes(_GLR_B + _DOMAIN_B)
+
+    # Derive Ed25519 keypair from seed (cached)
+    public_key_bytes, _secret_key = _genesis_keypair()
+    
+    # Compute zone ID: SHA-256(public_key)
+    zone_id = sha256_hex(public_key_bytes)
+    
+    return {
+        'seed': bytes_to_hex(seed),
+        'private_key': bytes_to_hex(seed),  # Ed25519 seed = private key
+        'public_key': bytes_to_hex(public_key_bytes),
+        'zone_id': zone_id
+    }
+
+
+# ============================================================================
+# ATTESTATION OPERATIONS
+# ============================================================================
+
+def compute_refs_hash(refs: List[str]) -> str:
+    """
+    Compute refs hash according to protocol.
+    
+    if refs is empty: refs_hash = GLR
+    else: refs_hash = SHA-256(join(sort(refs), "|"))
+    """
+    if not refs:
+        return GLR
+    return bytes_to_hex(compute_refs_hash_bytes(refs))
+
+
+_REFS_DELIMITER_B = REFS_DELIMITER.encode('utf-8')
+
+
+def compute_refs_hash_bytes(refs: List[str]) -> bytes:
+    """Bytes-native refs hash (hex form is produced only for the artifact)."""
+    if not refs:
+        return _GLR_B
+    # Stream the sorted refs into the hash state instead of joining them
+    # into one intermediate string first.
+    sorted_refs = sorted(refs)
+    h = _SHA256(sorted_refs[0].encode('utf-8'))
+    for ref in sorted_refs[1:]:
+        h.update(_REFS_DELIMITER_B)
+        h.update(ref.encode('utf-8'))
+    return h.digest()
+
+
+def compute_attestation_id(zone: str, subject: str, canon: str, time: int) -> str:
+    """
+    Compute attestation ID.
+
+    attestation_id = SHA-256(zone || subject || canon || BE64(time))
+    Input: 104 bytes (32 + 32 + 32 + 8)
+    """
+    return bytes_to_hex(compute_attestation_id_bytes(
+        hex_to_bytes(zone), hex_to_bytes(subject), hex_to_bytes(canon), time
+    ))
+
+
+# Reusable scratch buffer for the fixed-size signature input. Filling
+# slices in place avoids the intermediate bytes objects that per-field
+# concatenation would allocate on every call.
+_SIGN_BUF = bytearray(136)  # id || subject || BE64(time) || refs_hash || canon
+_TIME_SCRATCH = bytearray(8)  # BE64 timestamp written in place, never allocated
+
+
+def compute_attestation_id_bytes(zone: bytes, subject: bytes, canon: bytes, time: int) -> bytes:
+    """Bytes-native attestation ID over the 104-byte protocol input."""
+    # Feed the fields straight into the hash state; no joined buffer needed
+    # since only the digest leaves this function.
+    h = _SHA256()
+    h.update(zone)      # 32 bytes
+    h.update(subject)   # 32 bytes
+    h.update(canon)     # 32 bytes
+    struct.pack_into('>Q', _TIME_SCRATCH, 0, time)
+    h.update(_TIME_SCRATCH)  # 8 bytes
+    return h.digest()
+
+
+def build_signature_input(
+    attestation_id: str,
+    subject: str,
+    time: int,
+    refs_hash: str,
+    canon: str
+) -> bytes:
+    """
+    Build signature input.
+
+    sign_input = attestation_id || subject || BE64(time) || refs_hash || canon
+    Total: 136 bytes (32 + 32 + 8 + 32 + 32)
+    """
+    return build_signature_input_bytes(
+        hex_to_bytes(attestation_id), hex_to_bytes(subject), time,
+        hex_to_bytes(refs_hash), hex_to_bytes(canon)
+    )
+
+
+def build_signature_input_bytes(
+    attestation_id: bytes,
+    subject: bytes,
+    time: int,
+    refs_hash: bytes,
+    canon: bytes
+) -> bytes:
+    """Bytes-native signature input (136 bytes = 32 + 32 + 8 + 32 + 32)."""
+    _SIGN_BUF[0:32] = attestation_id
+    _SIGN_BUF[32:64] = subject
+    struct.pack_into('>Q', _SIGN_BUF, 64, time)
+    _SIGN_BUF[72:104] = refs_hash
+    _SIGN_BUF[104:136] = canon
+    return bytes(_SIGN_BUF)
+
+
+def sign_message(message: bytes, private_key_hex: str) -> str:
+    """Sign message with Ed25519 private key, return signature as hex."""
+    if not NACL_AVAILABLE:
+        raise RuntimeError("PyNaCl required for signing")
+    
+    seed = hex_to_bytes(private_key_hex)
+    _public_key, secret_key = crypto_sign_seed_keypair(seed)
+    signature = _sign_detached(message, secret_key)
+    return bytes_to_hex(signature)
+
+
+def verify_signature(message: bytes, signature_hex: str, public_key_hex: str) -> bool:
+    """Verify Ed25519 signature."""
+    if not NACL_AVAILABLE:
+        raise RuntimeError("PyNaCl required for verification")
+    
+    try:
+        _verify_detached(
+            hex_to_bytes(signature_hex), message, hex_to_bytes(public_key_hex)
+        )
+        return True
+    except Exception:
+        return False
+
+
+def create_genesis_attestation(zone: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Create the genesis attestation with cryptographic signature.
+    """
+    # Genesis subject: SHA-256("From nothing, truth emerges")
+    subject = bytes_to_hex(_SUBJECT_B)
+
+    # Genesis canon: SHA-256("raw:sha256:1.0")
+    canon = bytes_to_hex(_CANON_B)
+    
+    # Refs: [GLR]
+    refs = [GLR]
+    
+    # Compute attestation ID
+    attestation_id = compute_attestation_id(
+        zone['zone_id'], subject, canon, GENESIS_TIMESTAMP
+    )
+    
+    # Compute refs hash
+    refs_hash = compute_refs_hash(refs)
+    
+    # Build signature input (136 bytes)
+    sign_input = build_signature_input(
+        attestation_id, subject, GENESIS_TIMESTAMP, refs_hash, canon
+    )
+    
+    # Sign with the cached genesis secret key (no seed re-expansion)
+    if NACL_AVAILABLE:
+        _public_key, secret_key = _genesis_keypair()
+        proof = bytes_to_hex(_sign_detached(sign_input, secret_key))
+    else:
+        # Pre-computed signature (for verification mode)
+        proof = "9a06e9a971416bc167ce0edeb66961f1a15fac31296fb6add213e64fbb0b5172283bbb044fc5808794d2b1b42cb23b7dc8072e568cee3eb8c438294fe78b8008"
+    
+    return {
+        "id": attestation_id,
+        "zone": zone['zone_id'],
+        "subject": subject,
+        "canon": canon,
+        "time": GENESIS_TIMESTAMP,
+        "refs": refs,
+        "proof": proof
+    }
+
+
+@dataclass(frozen=True)
+class _AttBin:
+    """Attestation fields decoded to raw bytes for the verification path."""
+    id: bytes
+    zone: bytes
+    subject: bytes
+    canon: bytes
+    time: int
+    refs: Tuple[str, ...]
+    proof: bytes
+
+    @classmethod
+    def from_json(cls, att: Dict[str, Any]) -> '_AttBin':
+        return cls(
+            id=hex_to_bytes(att['id']),
+            zone=hex_to_bytes(att['zone']),
+            subject=hex_to_bytes(att['subject']),
+            canon=hex_to_bytes(att['canon']),
+            time=int(att['time']),
+            refs=tuple(att['refs']),
+            proof=hex_to_bytes(att['proof']),
+        )
+
+
+def verify_attestation(attestation: Dict[str, Any], public_key: str) -> Dict[str, Any]:
+    """
+    Verify an attestation's cryptographic integrity.
+    """
+    steps = []
+
+    # Decode every hex field exactly once; all checks below are raw
+    # 32-byte compares with no further hex parsing.
+    att = _AttBin.from_json(attestation)
+
+    # Step 1: Verify zone matches public key
+    computed_zone = sha256_bytes(hex_to_bytes(public_key))
+    zone_valid = computed_zone == att.zone
+    steps.append({
+        'name': 'Zone verification',
+        'passed': zone_valid,
+        'expected': attestation['zone'],
+        'actual': bytes_to_hex(computed_zone)
+    })
+
+    if not zone_valid:
+        return {'valid': False, 'error': 'Zone ID mismatch', 'steps': steps}
+
+    # Step 2: Verify attestation ID
+    computed_id = compute_attestation_id_bytes(
+        att.zone, att.subject, att.canon, att.time
+    )
+    id_valid = computed_id == att.id
+    steps.append({
+        'name': 'Attestation ID verification',
+        'passed': id_valid,
+        'expected': attestation['id'],
+        'actual': bytes_to_hex(computed_id)
+    })
+
+    if not id_valid:
+        return {'valid': False, 'error': 'Attestation ID mismatch', 'steps': steps}
+
+    # Step 3: Verify signature
+    refs_hash = compute_refs_hash_bytes(list(att.refs))
+    sign_input = build_signature_input_bytes(
+        att.id, att.subject, att.time, refs_hash, att.canon
+    )
+
+    if NACL_AVAILABLE:
+        try:
+            _verify_detached(att.proof, sign_input, hex_to_bytes(public_key))
+            sig_valid = True
+        except Exception:
+            sig_valid = False
+    else:
+        # Without nacl, we trust the pre-computed values match test vectors
+        sig_valid = True
+        steps.append({
+            'name': 'Signature verification',
+            'passed': True,
+            'note': 'Skipped (PyNaCl not available)'
+        })
+    
+    if NACL_AVAILABLE:
+        steps.append({
+            'name': 'Ed25519 signature verification',
+            'passed': sig_valid
+        })
+    
+    if not sig_valid:
+        return {'valid': False, 'error': 'Invalid signature', 'steps': steps}
+    
+    return {'valid': True, 'steps': steps}
+
+
+# One TLS context for every HTTPS request; building a fresh context per
+# call re-loads the CA store each time.
+_SSL_CTX = ssl.create_default_context()
+
+_HTTP_HEADERS = {'User-Agent': 'Glogos-Ceremony/1.0'}
+_HTTP_TIMEOUT = 10  # seconds; bounds tail latency like verify_full.py
+
+
+def verify_attestations_batch(attestations: List[Dict[str, Any]], public_key: str) -> List[bool]:
+    """
+    Verify the signatures of many attestations against one public key.
+
+    libsodium exposes no batch-verify entry point, but
+    the libsodium verify call releases the GIL, so spreading the
+    per-signature calls across a thread pool parallelizes the curve math
+    across cores. Signature inputs are built serially on the calling
+    thread because they share the module scratch buffer.
+    """
+    if not NACL_AVAILABLE:
+        raise RuntimeError("PyNaCl required for verification")
+
+    public_key_b = hex_to_bytes(public_key)
+
+    jobs = []
+    for attestation in attestations:
+        att = _AttBin.from_json(attestation)
+        refs_hash = compute_refs_hash_bytes(list(att.refs))
+        sign_input = build_signature_input_bytes(
+            att.id, att.subject, att.time, refs_hash, att.canon
+        )
+        jobs.append((att.proof, sign_input))
+
+    def _verify_one(job: Tuple[bytes, bytes]) -> bool:
+        proof, sign_input = job
+        try:
+            _verify_detached(proof, sign_input, public_key_b)
+            return True
+        except Exception:
+            return False
+
+    with ThreadPoolExecutor() as executor:
+        return list(executor.map(_verify_one, jobs))
+
+
+def _read_body(response) -> bytes:
+    """
+    Read an HTTP response into one right-sized buffer.
+
+    When Content-Length is known the whole body lands in a single
+    preallocated bytearray via readinto, instead of read()'s
+    geometric-growth reallocation.
+    """
+    length = int(response.headers.get('Content-Length', 0) or 0)
+    if length <= 0:
+        return response.read()
+    buf = bytearray(length)
+    view = memoryview(buf)
+    read = 0
+    while read < length:
+        n = response.readinto(view[read:])
+        if not n:
+            break
+        read += n
+    return bytes(buf[:read])
+
+
+def fetch_json(url: str) -> Any:
+    """Fetch JSON from URL."""
+    req = urllib.request.Request(url, headers=_HTTP_HEADERS)
+    with urllib.request.urlopen(req, timeout=_HTTP_TIMEOUT, context=_SSL_CTX) as response:
+        data = _read_body(response)
+        try:
+            # Both json.loads and orjson.loads take the raw bytes; orjson
+            # also skips the intermediate str entirely.
+            return _loads(data)
+        except ValueError:
+            return data.decode('utf-8').strip()
+
+
+def fetch_text(url: str) -> str:
+    """Fetch text from URL."""
+    req = urllib.request.Request(url, headers=_HTTP_HEADERS)
+    with urllib.request.urlopen(req, timeout=_HTTP_TIMEOUT, context=_SSL_CTX) as response:
+        return _read_body(response).decode('utf-8').strip()
+
+
+def fetch_bitcoin_tip() -> Tuple[str, int]:
+    """Fetch Bitcoin tip hash and height over one keepalive connection."""
+    conn = http.client.HTTPSConnection('blockstream.info', context=_SSL_CTX, timeout=10)
+    try:
+        conn.request('GET', '/api/blocks/tip/hash', headers=_HTTP_HEADERS)
+        block_hash = conn.getresponse().read().decode('utf-8').strip()
+        conn.request('GET', '/api/blocks/tip/height', headers=_HTTP_HEADERS)
+        block_height = conn.getresponse().read().decode('utf-8').strip()
+        return block_hash, int(block_height)
+    finally:
+        conn.close()
+
+
+def wait_for_ceremony_time():
+    """Wait until ceremony time with countdown."""
+    import time
+    target = _CEREMONY_DT
+    now = datetime.now(timezone.utc)
+    
+    if now < target:
+        print(f"\n[WAIT] Ceremony time: {target.isoformat()}")
+        print(f"       Current time:  {now.isoformat()}")
+        print(f"       (Press Ctrl+C to cancel)\n")
+        
+        # Tick on plain float timestamps: no datetime/timedelta objects are
+        # allocated per iteration, only integer arithmetic on the remainder.
+        target_ts = target.timestamp()
+        try:
+            while (rem := target_ts - time.time()) > 0:
+                seconds = int(rem)
+                days = seconds // 86400
+                hours, minutes, secs = (seconds % 86400) // 3600, (seconds % 3600) // 60, seconds % 60
+
+                if seconds > 60:
+                    msg = f"   Waiting... {days}d {hours:02d}h {minutes:02d}m {secs:02d}s remaining"
+                else:
+                    msg = f"   Countdown: {seconds}s...                      "
+
+                print(f"\r{msg}", end="", flush=True)
+                # Sleep as long as the display allows instead of polling at
+                # 10 Hz: one wakeup a minute while far out, one a second in
+                # the final minutes, fine-grained only at the very end.
+                delay = 60.0 if seconds > 120 else 1.0 if seconds > 2 else 0.1
+                time.sleep(min(delay, rem))
+        except KeyboardInterrupt:
+            print("\n\nCancelled.")
+            sys.exit(0)
+        
+        print("\n[!] CEREMONY TIME!")
+
+
+def verify_artifact() -> bool:
+    """Verify genesis-artifact.json against GENESIS.md spec."""
+    print("\n[VERIFY] Genesis Artifact")
+    print("=" * 50)
+    
+    # Load artifact
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    artifact_path = os.path.join(os.path.dirname(script_dir), 'shared', 'artifacts', 'genesis-artifact.json')
+    
+    try:
+        with open(artifact_path, 'r') as f:
+            artifact = json.load(f)
+    except FileNotFoundError:
+        print(f"✗ Artifact not found: {artifact_path}")
+        return False
+    
+    att = artifact['attestation']
+
+    def _fail() -> bool:
+        print("=" * 50)
+        print("Result: ✗ FAILED")
+        return False
+
+    # Each check aborts on first failure: later steps build on earlier
+    # ones, so there is nothing meaningful to report past a mismatch.
+
+    # 1. Verify GLR (raw digest compare against the decoded constant)
+    glr_ok = sha256_bytes(b"") == _GLR_B
+    print(f"[1] GLR = SHA256(''): {'✓' if glr_ok else '✗'}")
+    if not glr_ok:
+        return _fail()
+
+    # 2. Verify zone derivation (cached, or the pre-computed constant
+    # when PyNaCl is missing — no key derivation runs in that case)
+    zone = derive_genesis_zone()
+    zone_ok = zone['zone_id'] == att['zone']
+    print(f"[2] Zone ID matches: {'✓' if zone_ok else '✗'}")
+    if not zone_ok:
+        return _fail()
+
+    # 3. Verify subject (precomputed digest, no per-run re-hash)
+    subject_ok = hex_to_bytes(att['subject']) == _SUBJECT_B
+    print(f"[3] Subject matches: {'✓' if subject_ok else '✗'}")
+    if not subject_ok:
+        return _fail()
+
+    # 4. Verify canon
+    canon_ok = hex_to_bytes(att['canon']) == _CANON_B
+    print(f"[4] Canon matches: {'✓' if canon_ok else '✗'}")
+    if not canon_ok:
+        return _fail()
+
+    # 5. Verify attestation ID
+    expected_id = compute_attestation_id(att['zone'], att['subject'], att['canon'], att['time'])
+    id_ok = expected_id == att['id']
+    print(f"[5] Attestation ID: {'✓' if id_ok else '✗'}")
+    if not id_ok:
+        return _fail()
+
+    # 6. Verify signature
+    if NACL_AVAILABLE:
+        verification = verify_attestation(att, zone['public_key'])
+        sig_ok = verification['valid']
+        print(f"[6] Ed25519 signature: {'✓' if sig_ok else '✗'}")
+        if not sig_ok:
+            return _fail()
+    else:
+        print("[6] Ed25519 signature: ⚠ Skipped (PyNaCl not available)")
+
+    print("=" * 50)
+    print("Result: ✓ ALL PASSED")
+    return True
+
+
+def main():
+    print("\n╔═══════════════════════════════════════════════════════════════╗")
+    print("║           GLOGOS GENESIS CEREMONY                             ║")
+    print("║           Winter Solstice 2025                                ║")
+    print("╚═══════════════════════════════════════════════════════════════╝\n")
+
+    if NACL_AVAILABLE:
+        print("✓ PyNaCl available - Full cryptographic mode\n")
+    else:
+        print("⚠ PyNaCl not available - Verification mode only\n")
+
+    # Interactive menu
+    print("Options:")
+    print("  [1] Run ceremony (simulation)")
+    print("  [2] Run ceremony (live)")
+    print("  [3] Verify genesis artifact")
+    print()
+    
+    choice = input("Select (1-3) [1]: ").strip() or "1"
+    
+    if choice == "3":
+        verify_artifact()
+        return
+    
+    if choice == "2":
+        # Disable live mode after genesis + 1 day
+        deadline = _CEREMONY_DT + timedelta(days=1)
+        if datetime.now(timezone.utc) > deadline:
+            print("\n⚠ Genesis ceremony đã qua. Dùng option [1] simulation thay.")
+            return
+        wait_for_ceremony_time()
+
+    ceremony_time = _CEREMONY_STR
+    current_time = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
+    print(f"\nCeremony time: {ceremony_time}")
+    print(f"Current time:  {current_time}\n")
+
+    # ============================================
+    # STEP 1: DERIVE GENESIS ZONE
+    # ============================================
+    print("=" * 65)
+    print("STEP 1: DERIVE GENESIS ZONE FROM GLR")
+    print("=" * 65)
+    
+    print("\n[1/3] Computing seed: SHA-256(GLR || domain_separator)...")
+    genesis_zone = derive_genesis_zone()
+    print(f"    ✓ Seed:       {genesis_zone['seed'][:32]}...")
+    
+    print("\n[2/3] Deriving Ed25519 keypair from seed...")
+    print(f"    ✓ Public Key: {genesis_zone['public_key'][:32]}...")
+    
+    print("\n[3/3] Computing zone ID: SHA-256(public_key)...")
+    print(f"    ✓ Zone ID:    {genesis_zone['zone_id'][:32]}...")
+
+    # ============================================
+    # STEP 2: CREATE GENESIS ATTESTATION
+    # ============================================
+    print("\n" + "=" * 65)
+    print("STEP 2: CREATE GENESIS ATTESTATION")
+    print("=" * 65)
+
+    print("\n[1/4] Computing genesis subject: SHA-256('From nothing, truth emerges')...")
+    genesis_subject = bytes_to_hex(_SUBJECT_B)
+    print(f"    ✓ Subject:    {genesis_subject[:32]}...")
+
+    print("\n[2/4] Computing canon ID: SHA-256('raw:sha256:1.0')...")
+    genesis_canon = bytes_to_hex(_CANON_B)
+    print(f"    ✓ Canon:      {genesis_canon[:32]}...")
+
+    print("\n[3/4] Computing attestation ID...")
+    genesis_attestation = create_genesis_attestation(genesis_zone)
+    print(f"    ✓ ID:         {genesis_attestation['id'][:32]}...")
+
+    print("\n[4/4] Signing attestation (Ed25519)...")
+    print(f"    ✓ Signature:  {genesis_attestation['proof'][:32]}...")
+
+    # ============================================
+    # STEP 3: VERIFY ATTESTATION
+    # ============================================
+    print("\n" + "=" * 65)
+    print("STEP 3: VERIFY ATTESTATION")
+    print("=" * 65)
+
+    verification = verify_attestation(genesis_attestation, genesis_zone['public_key'])
+    for step in verification['steps']:
+        status = "✓" if step['passed'] else "✗"
+        print(f"    {status} {step['name']}")
+    
+    if verification['valid']:
+        print("\n    ✓ ATTESTATION VERIFIED SUCCESSFULLY")
+    else:
+        print(f"\n    ✗ VERIFICATION FAILED: {verification.get('error', 'Unknown error')}")
+        return
+
+    # ============================================
+    # STEP 4: FETCH ENTROPY WITNESSES
+    # ============================================
+    print("\n" + "=" * 65)
+    print("STEP 4: FETCH ENTROPY WITNESSES")
+    print("=" * 65)
+
+    fetched_at = datetime.now(timezone.utc).isoformat()
+
+    # Check if we're more than 1 hour past ceremony time for live mode
+    if choice == "2":
+        time_diff = (datetime.now(timezone.utc) - _CEREMONY_DT).total_seconds()
+
+        if time_diff > 3600:  # More than 1 hour (3600 seconds)
+            print(f"\n⚠️  Current time is {int(time_diff / 3600)} hours past ceremony time.")
+            print("   Entropy data is no longer realtime for the ceremony.")
+            print("   Please use option [3] to verify the existing genesis artifact.")
+            print("\nExiting...")
+            return
+
+    if choice == "1":
+        print("\n[SIMULATION] Using mock entropy data...")
+        drand = {
+            "source": "drand_quicknet (mock)",
+            "chain_hash": DRAND_CHAIN_HASH,
+            "round": 1234567,
+            "randomness": "de7e000000000000000000000000000000000000000000000000000000000000",
+            "signature": "de7e00000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000",
+            "fetched_at": fetched_at
+        }
+        nist = {
+            "source": "nist_beacon (mock)",
+            "output_value": "de7e00000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000",
+            "pulse_index": 1234567,
+            "fetched_at": fetched_at
+        }
+        bitcoin = {
+            "source": "bitcoin_block (mock)",
+            "block_hash": "00000000000000000000de7e0000000000000000000000000000000000000000",
+            "block_height": 1234567,
+            "fetched_at": fetched_at
+        }
+        print("    ✓ Drand (Mock)")
+        print("    ✓ NIST (Mock)")
+        print("    ✓ Bitcoin (Mock)")
+    else:
+        # Issue all fetches concurrently: each one blocks on TLS + RTT, so
+        # overlapping them makes a cold run take as long as the slowest
+        # source instead of the sum of all of them.
+        executor = ThreadPoolExecutor(max_workers=4)
+        drand_future = executor.submit(fetch_json, DRAND_ENDPOINT)
+        nist_future = executor.submit(fetch_json, NIST_BEACON_URL)
+        btc_future = executor.submit(fetch_bitcoin_tip)
+
+        # Collect drand
+        print("\n[1/3] Fetching drand quicknet...")
+        drand = {"source": "drand_quicknet", "error": None}
+        try:
+            data = drand_future.result()
+            drand = {
+                "source": "drand_quicknet",
+                "chain_hash": DRAND_CHAIN_HASH,
+                "round": data['round'],
+                "randomness": data['randomness'],
+                "signature": data['signature'],
+                "fetched_at": fetched_at
+            }
+            print(f"    ✓ Round: {drand['round']}")
+            print(f"    ✓ Randomness: {drand['randomness'][:32]}...")
+        except Exception as e:
+            drand['error'] = str(e)
+            print(f"    ✗ Error: {e}")
+
+        # Collect NIST Beacon
+        print("\n[2/3] Fetching NIST Randomness Beacon...")
+        nist = {"source": "nist_beacon", "error": None}
+        try:
+            data = nist_future.result()
+            pulse = data.get('pulse', {})
+            nist = {
+                "source": "nist_beacon",
+                "output_value": pulse.get('outputValue'),
+                "pulse_index": pulse.get('pulseIndex'),
+                "fetched_at": fetched_at
+            }
+            print(f"    ✓ Pulse: {nist['pulse_index']}")
+            print(f"    ✓ Value: {nist['output_value'][:32] if nist['output_value'] else 'N/A'}...")
+        except Exception as e:
+            nist['error'] = str(e)
+            print(f"    ✗ Error: {e}")
+
+        # Collect Bitcoin
+        print("\n[3/3] Fetching Bitcoin block...")
+        bitcoin = {"source": "bitcoin_block", "error": None}
+        try:
+            block_hash, block_height = btc_future.result()
+            bitcoin = {
+                "source": "bitcoin_block",
+                "block_hash": block_hash,
+                "block_height": block_height,
+                "fetched_at": fetched_at
+            }
+            print(f"    ✓ Height: {bitcoin['block_height']}")
+            print(f"    ✓ Hash: {bitcoin['block_hash'][:32]}...")
+        except Exception as e:
+            bitcoin['error'] = str(e)
+            print(f"    ✗ Error: {e}")
+
+        executor.shutdown()
+
+
+    # Add time representations
+    witnesses = {
+        "_note": "Supplementary entropy witnesses - does NOT affect attestation",
+        "time": {
+            "gregorian": _CEREMONY_STR,
+            "julian_day": 2461031.1270833333,
+            "lunar": "Month 11, Day 21",
+            "vigesimal": "13.0.13.3.8",
+            "sexagesimal": "11;23,37,11;7,37,30"
+        },
+        "euler": {
+            "expression": "e^(iπ) + 1 = 0",
+            "meaning": "The most beautiful equation witnesses the genesis"
+        },
+        "entropy": {
+            "fetched_at": fetched_at,
+            "drand": drand,
+            "nist": nist,
+            "bitcoin": bitcoin
+        },
+
+    }
+
+    # ============================================
+    # STEP 5: SAVE ARTIFACTS
+    # ============================================
+    print("\n" + "=" * 65)
+    print("STEP 5: SAVE ARTIFACTS")
+    print("=" * 65)
+
+    artifact = {
+        "_ceremony": "Winter Solstice Genesis 2025",
+        "_timestamp": ceremony_time,
+        "attestation": genesis_attestation,
+        "witnesses": witnesses
+    }
+
+    # Save artifacts
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    shared_dir = os.path.join(os.path.dirname(script_dir), 'shared')
+    
+    artifacts_dir = os.path.join(shared_dir, 'artifacts')
+    artifact_path = os.path.join(artifacts_dir, 'genesis-artifact.json')
+
+    # Serialize once, write once, then rename into place so a crash mid-save
+    # never leaves a truncated artifact.
+    if ORJSON_AVAILABLE:
+        buf = orjson.dumps(artifact, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    else:
+        buf = (json.dumps(artifact, indent=2, ensure_ascii=False) + '\n').encode('utf-8')
+    tmp_path = artifact_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(buf)
+    os.replace(tmp_path, artifact_path)
+    print(f"\n✓ Saved: {artifact_path}")
+
+    # ============================================
+    # FINAL SUMMARY
+    # ============================================
+    print("\n" + "=" * 65)
+    print("CEREMONY COMPLETE")
+    print("=" * 65)
+    print("\nGenesis Attestation:")
+    print(json.dumps(genesis_attestation, indent=2, ensure_ascii=False))
+    print("\n" + "-" * 65)
+    print("Re-run this script to verify deterministic output.")
+    print("The attestation ID and signature will be IDENTICAL each time.")
+    print("-" * 65)
+    print("\nFrom nothing, truth emerges.")
+    print("=" * 65 + "\n")
+
+
+if __name__ == '__main__':
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n\nCeremony cancelled by user.")
+    except Exception as e:
+        print(f"\n\nError: {e}")
+        import traceback
+        traceback.print_exc()
+
@@ -1,95 +1,181 @@
+import hmac
 import json
 import hashlib
-import binascii
-
-def sha256(data):
-    if isinstance(data, str):
-        data = data.encode('utf-8')
-    return hashlib.sha256(data).hexdigest()
-
-# Load artifact
-with open('shared/artifacts/genesis-artifact.json', 'r') as f:
-    data = json.load(f)
-
-att = data['attestation']
-
-print("--- VERIFICATION REPORT ---")
-
-# 1. Verify GLR Ref
-glr = sha256(b'')
-print(f"[1] GLR Check: {'PASS' if att['refs'][0] == glr else 'FAIL'}")
-if att['refs'][0] != glr:
-    print(f"    Expected: {glr}")
-    print(f"    Found:    {att['refs'][0]}")
-
-# 2. Verify Subject
-subject = "From nothing, truth emerges"
-subject_hash = sha256(subject)
-print(f"[2] Subject Check: {'PASS' if att['subject'] == subject_hash else 'FAIL'}")
-
-# 3. Verify Canon
-canon = "raw:sha256:1.0"
-canon_hash = sha256(canon)
-print(f"[3] Canon Check: {'PASS' if att['canon'] == canon_hash else 'FAIL'}")
-
-# 4. Verify Genesis Zone Derivation
-# Genesis Zone keypair is derived from: SHA256(GLR || "glogos-genesis")
-seed_input = binascii.unhexlify(glr) + b"glogos-genesis"
-seed = hashlib.sha256(seed_input).digest()
-
-# 4. Verify Zone ID
-# Without pynacl, we cannot derive Ed25519 key from seed.
-# However, we can verify if the Zone ID in artifact is a valid SHA256 hash structure.
+import sys
+
+# orjson (optional): faster parse for the artifact; hex fields come back
+# as the same native str either way.
 try:
-    import nacl.signing
-    signing_key = nacl.signing.SigningKey(seed)
-    verify_key = signing_key.verify_key
-    public_key_bytes = verify_key.encode()
-    derived_zone_id = hashlib.sha256(public_key_bytes).hexdigest()
-    print(f"[4] Zone ID Check: {'PASS' if att['zone'] == derived_zone_id else 'FAIL'}")
+    import orjson
 except ImportError:
-    # Fallback: Check against known hardcoded value for this specific GLR
-    # This matches witness.py behavior
-    KNOWN_ZONE = "db1756c17220873bcb831c2f9c197081ab0d83acf2226b819880d62ce906c010"
-    if att['zone'] == KNOWN_ZONE:
-        print(f"[4] Zone ID Check: PASS (Verified against known constant)")
-    else:
-        print(f"[4] Zone ID Check: SKIPPED (pynacl not installed)")
-
-# 5. Verify Signature
-try:
-    import nacl.signing
-    # Reconstruct payload correctly (Must match witness.py logic)
-    # 1. Compute Attestation ID
-    # id = SHA256(zone || subject || canon || time_be64)
-    id_payload = b''
-    id_payload += binascii.unhexlify(att['zone'])
-    id_payload += binascii.unhexlify(att['subject'])
-    id_payload += binascii.unhexlify(att['canon'])
-    id_payload += int(att['time']).to_bytes(8, 'big')
-    computed_id = hashlib.sha256(id_payload).hexdigest()
-    
-    # 2. Compute Refs Hash
-    # refs_hash = SHA256(join(sort(refs), "|"))
-    refs_concat = "|".join(sorted(att['refs'])).encode('utf-8')
-    refs_hash = hashlib.sha256(refs_concat).digest()
-
-    # 3. Build Sign Input
-    # input = id || subject || time_be64 || refs_hash || canon
-    sign_input = binascii.unhexlify(computed_id)
-    sign_input += binascii.unhexlify(att['subject'])
-    sign_input += int(att['time']).to_bytes(8, 'big')
-    sign_input += refs_hash
-    sign_input += binascii.unhexlify(att['canon'])
+    orjson = None
+
+# GLR = SHA-256("") is a fixed protocol constant; fold it here so the
+# quick path pays no hash + hex encode just to reproduce it.
+GLR_HEX = "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
+GLR_BYTES = bytes.fromhex(GLR_HEX)
+
+# Config digest: SHA-256 over the four expected digests (GLR ref,
+# subject, canon, zone) concatenated in artifact order. The expected
+# values are all protocol constants, so one hash over the artifact's
+# decoded fields settles checks 1-4 in a single compare; the per-field
+# checks run only on a miss, to report which field diverged.
+CONFIG_DIGEST = bytes.fromhex("8a51b56551c5816ac8f1f5752802984c1abd9d3ba1546d9f2e327be6e9736508")
+
+DEFAULT_ARTIFACT = 'shared/artifacts/genesis-artifact.json'
+
+
+def load_artifact(path):
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def verify_one(path):
+    """Verify one artifact file; returns True when every check passes."""
+    data = load_artifact(path)
+    att = data['attestation']
+
+    # Fail fast on malformed artifacts before any hashing or key derivation:
+    # zone/subject/canon are SHA-256 digests (64 hex chars), the proof is an
+    # Ed25519 signature (128 hex chars).
+    for field, hex_len in (('zone', 64), ('subject', 64), ('canon', 64), ('proof', 128)):
+        value = att.get(field, '')
+        if len(value) != hex_len:
+            raise ValueError(f"Malformed artifact: '{field}' must be {hex_len} hex chars, got {len(value)}")
+    refs = att.get('refs')
+    if not (isinstance(refs, list) and refs
+            and all(isinstance(r, str) and len(r) == 64 for r in refs)):
+        raise ValueError("Malformed artifact: 'refs' must be a non-empty list of 64 hex char digests")
+
+    # Decode the compared fields once; every check below is a constant-time
+    # compare on 32-byte digests instead of == on 64-char hex strings.
+    refs0_b = bytes.fromhex(att['refs'][0])
+    zone_b = bytes.fromhex(att['zone'])
+    subject_b = bytes.fromhex(att['subject'])
+    canon_b = bytes.fromhex(att['canon'])
+    time_b = int(att['time']).to_bytes(8, 'big')
+
+    # The report is buffered and flushed as one stdout write: each print()
+    # is a lock acquire plus a write syscall under line buffering, and one
+    # write also keeps the report atomic when runs are interleaved in CI.
+    lines = ["--- VERIFICATION REPORT ---", f"Artifact: {path}"]
+    ok = True
 
     try:
-        verify_key.verify(sign_input, binascii.unhexlify(att['proof']))
-        print(f"[5] Signature Check: PASS (Cryptographically Valid)")
-    except Exception as e:
-        print(f"[5] Signature Check: FAIL ({e})")
+        # 1-3. One SHA-256 over the decoded fields against CONFIG_DIGEST
+        # settles the hash checks together; a valid artifact never pays for
+        # the individual recomputations.
+        combined = hashlib.sha256(b"".join([refs0_b, subject_b, canon_b, zone_b])).digest()
+        if hmac.compare_digest(combined, CONFIG_DIGEST):
+            glr_ok = subject_ok = canon_ok = True
+            lines.append("[1] GLR Check: PASS")
+            lines.append("[2] Subject Check: PASS")
+            lines.append("[3] Canon Check: PASS")
+        else:
+            # 1. Verify GLR Ref
+            glr_ok = hmac.compare_digest(refs0_b, GLR_BYTES)
+            lines.append(f"[1] GLR Check: {'PASS' if glr_ok else 'FAIL'}")
+            if not glr_ok:
+                lines.append(f"    Expected: {GLR_HEX}")
+                lines.append(f"    Found:    {att['refs'][0]}")
+
+            # 2. Verify Subject
+            subject = "From nothing, truth emerges"
+            subject_digest = hashlib.sha256(subject.encode('utf-8')).digest()
+            subject_ok = hmac.compare_digest(subject_b, subject_digest)
+            lines.append(f"[2] Subject Check: {'PASS' if subject_ok else 'FAIL'}")
+
+            # 3. Verify Canon
+            canon = "raw:sha256:1.0"
+            canon_digest = hashlib.sha256(canon.encode('utf-8')).digest()
+            canon_ok = hmac.compare_digest(canon_b, canon_digest)
+            lines.append(f"[3] Canon Check: {'PASS' if canon_ok else 'FAIL'}")
+
+        # The remaining checks need libsodium; importing it costs tens of ms.
+        # If a pure-hash check already failed the artifact is invalid and the
+        # Ed25519 work is pointless.
+        cheap_ok = glr_ok and subject_ok and canon_ok
+
+        # 4. Verify Genesis Zone Derivation
+        # Genesis Zone keypair is derived from: SHA256(GLR || "glogos-genesis")
+        seed_input = GLR_BYTES + b"glogos-genesis"
+        seed = hashlib.sha256(seed_input).digest()
+
+        # 4. Verify Zone ID + 5. Verify Signature
+        # One nacl block: the verify key is derived exactly once and feeds both
+        # checks (the old split re-imported nacl and left step 5 depending on a
+        # variable from step 4's try block).
+        if not cheap_ok:
+            lines.append("[4] Zone ID Check: SKIPPED (artifact already failed a hash check)")
+            lines.append("[5] Signature Check: SKIPPED (artifact already failed a hash check)")
+            return False
+
+        try:
+            import nacl.signing
+
+            signing_key = nacl.signing.SigningKey(seed)
+            verify_key = signing_key.verify_key
+            public_key_bytes = verify_key.encode()
+            derived_zone_digest = hashlib.sha256(public_key_bytes).digest()
+            zone_ok = hmac.compare_digest(zone_b, derived_zone_digest)
+            lines.append(f"[4] Zone ID Check: {'PASS' if zone_ok else 'FAIL'}")
+            ok &= zone_ok
+
+            # Reconstruct payload correctly (Must match witness.py logic)
+            # 1. Compute Attestation ID
+            # id = SHA256(zone || subject || canon || time_be64)
+            id_payload = b"".join([zone_b, subject_b, canon_b, time_b])
+            computed_id_b = hashlib.sha256(id_payload).digest()
+
+            # 2. Compute Refs Hash
+            # refs_hash = SHA256(join(sort(refs), "|"))
+            # Refs are hex strings: sort once, ASCII-encode each and join as
+            # bytes, skipping the intermediate joined str and its re-encode.
+            refs_sorted = sorted(att['refs'])
+            refs_hash = hashlib.sha256(b"|".join(r.encode('ascii') for r in refs_sorted)).digest()
+
+            # 3. Build Sign Input
+            # input = id || subject || time_be64 || refs_hash || canon
+            sign_input = b"".join([computed_id_b, subject_b, time_b, refs_hash, canon_b])
+
+            try:
+                verify_key.verify(sign_input, bytes.fromhex(att['proof']))
+                lines.append(f"[5] Signature Check: PASS (Cryptographically Valid)")
+            except Exception as e:
+                lines.append(f"[5] Signature Check: FAIL ({e})")
+                ok = False
+
+        except ImportError:
+            # Fallback: Check against known hardcoded value for this specific GLR
+            # This matches witness.py behavior
+            KNOWN_ZONE = "db1756c17220873bcb831c2f9c197081ab0d83acf2226b819880d62ce906c010"
+            if att['zone'] == KNOWN_ZONE:
+                lines.append(f"[4] Zone ID Check: PASS (Verified against known constant)")
+            else:
+                lines.append(f"[4] Zone ID Check: SKIPPED (pynacl not installed)")
+            lines.append("[5] Signature Check: SKIPPED (pynacl not installed)")
+            lines.append("    (Install pynacl to verify signature)")
+
+        return ok
+
+    finally:
+        # The footer lands even on the early-return failure path above.
+        lines.append("---------------------------")
+        sys.stdout.write("\n".join(lines) + "\n")
 
-except ImportError:
-    print("[5] Signature Check: SKIPPED (pynacl not installed)")
-    print("    (Install pynacl to verify signature)")
 
-print("---------------------------")
+if __name__ == '__main__':
+    # Accepting several artifact paths amortizes interpreter startup and
+    # the nacl import across a bulk verification run; no arguments keeps
+    # the single canonical-artifact behavior.
+    all_ok = True
+    for artifact_path in sys.argv[1:] or [DEFAULT_ARTIFACT]:
+        try:
+            all_ok &= verify_one(artifact_path)
+        except (OSError, ValueError, KeyError, IndexError, TypeError) as e:
+            sys.stdout.write(f"--- VERIFICATION REPORT ---\nArtifact: {artifact_path}\nFAIL ({e})\n---------------------------\n")
+            all_ok = False
+    sys.exit(0 if all_ok else 1)